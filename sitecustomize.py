@@ -7,5 +7,5 @@ import sys
 
 _here = os.path.dirname(__file__)
 src = os.path.join(_here, "src")
-if os.path.isdir(src) and src not in sys.path:
+if src not in sys.path and os.path.isdir(src):
     sys.path.insert(0, src)
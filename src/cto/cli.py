@@ -1,17 +1,15 @@
 from __future__ import annotations
 
-import asyncio
 import logging
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import typer
 
 from . import __version__
 from .config import AppConfig, ensure_directories, load_config
-from .overlay import init_overlay, list_overlay_files
-from .server import run_server
 
 app = typer.Typer(help="CLI for the ADB simulator development environment and overlay management.")
 overlay_app = typer.Typer(help="Manage overlay data (commands, props).")
@@ -37,6 +35,36 @@ def _setup_logging(debug: bool, logs_dir: Path) -> None:
     )
 
 
+@contextmanager
+def _queued_logging() -> Iterator[None]:
+    # While the server runs, the event loop only enqueues records and a listener thread
+    # does the console/file writes. Imported here to keep short commands' startup lean.
+    import logging.handlers
+    import queue
+
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    if not handlers:
+        yield
+        return
+    q: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    # No formatter on the QueueHandler: it only merges args into the message, and the
+    # original handlers apply their own format on the listener side
+    queue_handler = logging.handlers.QueueHandler(q)
+    listener = logging.handlers.QueueListener(q, *handlers, respect_handler_level=True)
+    for h in handlers:
+        root.removeHandler(h)
+    root.addHandler(queue_handler)
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+        root.removeHandler(queue_handler)
+        for h in handlers:
+            root.addHandler(h)
+
+
 @app.callback()
 def _load_config(
     ctx: typer.Context,
@@ -70,6 +98,11 @@ def run(
     port: Optional[int] = typer.Option(None, help="Server bind port. Overrides config."),
 ) -> None:
     """Start the ADB simulator server (asyncio stub)."""
+    # Imported here so other subcommands don't load asyncio at startup
+    import asyncio
+
+    from .server import run_server
+
     assert isinstance(ctx.obj, State)
     cfg = ctx.obj.config
     ensure_directories(cfg)
@@ -79,7 +112,8 @@ def run(
     typer.echo(f"Starting ADB simulator on {h}:{p} (press Ctrl+C to stop)...")
 
     try:
-        asyncio.run(run_server(h, p, cfg.paths.logs_dir))
+        with _queued_logging():
+            asyncio.run(run_server(h, p, cfg.paths.logs_dir))
     except KeyboardInterrupt:
         typer.echo("Shutting down...")
 
@@ -91,6 +125,8 @@ app.command(name="start")(run)
 @overlay_app.command("init")
 def overlay_init(ctx: typer.Context) -> None:
     """Create overlay directories if they do not exist."""
+    from .overlay import init_overlay
+
     assert isinstance(ctx.obj, State)
     init_overlay(ctx.obj.config)
     typer.echo(str(ctx.obj.config.paths.overlay_dir))
@@ -106,6 +142,8 @@ def overlay_path(ctx: typer.Context) -> None:
 @overlay_app.command("ls")
 def overlay_ls(ctx: typer.Context) -> None:
     """List files inside the overlay directory."""
+    from .overlay import list_overlay_files
+
     assert isinstance(ctx.obj, State)
     files = list_overlay_files(ctx.obj.config)
     if not files:
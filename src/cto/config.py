@@ -6,20 +6,25 @@ from typing import Any, Dict, Optional, Tuple
 import os
 import sys
 import logging
-
-try:
-    import tomllib  # Python 3.11+
-except ModuleNotFoundError:  # pragma: no cover - for safety if run on <3.11
-    import tomli as tomllib  # type: ignore[no-redef]
-
-import yaml
+import time
 
 log = logging.getLogger(__name__)
 
 
 CONFIG_FILENAMES_TOML = ("cto.toml", "config.toml")
 CONFIG_FILENAMES_YAML = ("cto.yaml", "cto.yml", "config.yaml", "config.yml")
+CONFIG_FILENAMES = (*CONFIG_FILENAMES_TOML, *CONFIG_FILENAMES_YAML)  # in priority order
 DEFAULT_CONFIG_DIR_UNIX = Path.home() / ".config" / "cto"
+# Parsed config files, keyed by absolute path and fingerprinted by (mtime_ns, size).
+# Honours XDG_CACHE_HOME; per the XDG spec a relative value is ignored.
+_XDG_CACHE_HOME = os.environ.get("XDG_CACHE_HOME", "")
+CONFIG_CACHE_DIR = (
+    Path(_XDG_CACHE_HOME) if os.path.isabs(_XDG_CACHE_HOME) else Path.home() / ".cache"
+) / "cto"
+CONFIG_CACHE_FILE = CONFIG_CACHE_DIR / "config.pkl"
+# Files modified this recently are not cached: on coarse-mtime filesystems a same-size
+# edit within the same tick would leave the fingerprint unchanged (git's "racy clean")
+CONFIG_CACHE_RACY_NS = 2_000_000_000
 
 
 @dataclass(frozen=True)
@@ -56,32 +61,129 @@ def _find_config_file(explicit: Optional[Path]) -> Optional[Path]:
         if p.exists():
             return p
 
+    # The cwd can be arbitrarily large ($HOME, a data directory), so probe it by name
     cwd = Path.cwd()
-    for name in (*CONFIG_FILENAMES_TOML, *CONFIG_FILENAMES_YAML):
+    for name in CONFIG_FILENAMES:
         candidate = cwd / name
-        if candidate.exists():
+        if candidate.is_file():
             return candidate
 
     # Home config directory
-    for name in (*CONFIG_FILENAMES_TOML, *CONFIG_FILENAMES_YAML):
-        candidate = DEFAULT_CONFIG_DIR_UNIX / name
-        if candidate.exists():
-            return candidate
-
+    return _find_in_dir(DEFAULT_CONFIG_DIR_UNIX)
+
+
+def _find_in_dir(directory: Path) -> Optional[Path]:
+    # One directory read instead of a stat per candidate name; only used for the small,
+    # dedicated config directory where the read is cheaper than the probes
+    try:
+        with os.scandir(directory) as it:
+            present = {e.name for e in it if e.name in CONFIG_FILENAMES}
+    except OSError:
+        return None
+    for name in CONFIG_FILENAMES:
+        if name in present and (directory / name).is_file():
+            return directory / name
     return None
 
 
-def _read_toml(p: Path) -> Dict[str, Any]:
-    with p.open("rb") as f:
-        return tomllib.load(f)  # type: ignore[no-any-return]
+def _read_toml(data: bytes) -> Dict[str, Any]:
+    # Parsers are imported on first use so runs without a config file never pay for them
+    try:
+        import tomllib  # Python 3.11+
+    except ModuleNotFoundError:  # pragma: no cover - for safety if run on <3.11
+        import tomli as tomllib  # type: ignore[no-redef]
 
+    return tomllib.loads(data.decode("utf-8"))
 
-def _read_yaml(p: Path) -> Dict[str, Any]:
-    with p.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
-    if not isinstance(data, dict):
+
+def _read_yaml(data: bytes, p: Path) -> Dict[str, Any]:
+    import yaml
+
+    parsed = yaml.safe_load(data.decode("utf-8")) or {}
+    if not isinstance(parsed, dict):
         raise ValueError(f"YAML config must be a mapping at top-level: {p}")
-    return data
+    return parsed
+
+
+def _read_fd(fd: int, size: int) -> bytes:
+    # Asking for one byte past the stat size makes the common case a single read(2)
+    # that both fetches the file and confirms EOF
+    data = os.read(fd, size + 1)
+    if len(data) <= size:
+        return data
+    chunks = [data]
+    while chunk := os.read(fd, 65536):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _load_cache() -> Dict[str, Tuple[int, int, Dict[str, Any]]]:
+    # pickle/tempfile are imported here rather than at module level to keep them off
+    # the startup path of runs that never touch the cache
+    import pickle
+
+    try:
+        with CONFIG_CACHE_FILE.open("rb") as f:
+            data = pickle.load(f)
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _store_cache(cache: Dict[str, Tuple[int, int, Dict[str, Any]]]) -> None:
+    import pickle
+    import tempfile
+
+    # Best effort: a cache that can't be written must never fail the config load
+    try:
+        CONFIG_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CONFIG_CACHE_FILE.parent, suffix=".tmp")
+    except OSError as exc:
+        log.debug("Could not write config cache %s: %s", CONFIG_CACHE_FILE, exc)
+        return
+    # Write to a sibling temp file and rename so concurrent runs never see a torn file
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, CONFIG_CACHE_FILE)
+    except BaseException as exc:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        if not isinstance(exc, Exception):
+            raise
+        log.debug("Could not write config cache %s: %s", CONFIG_CACHE_FILE, exc)
+
+
+def _read_config_file(p: Path) -> Dict[str, Any]:
+    key = os.path.abspath(p)
+    fd = os.open(p, os.O_RDONLY)
+    try:
+        st = os.fstat(fd)
+        cache = _load_cache()
+        hit = cache.get(key)
+        # Anything other than a well-formed (mtime_ns, size, mapping) entry is a miss
+        if (
+            isinstance(hit, tuple)
+            and len(hit) == 3
+            and hit[0] == st.st_mtime_ns
+            and hit[1] == st.st_size
+            and isinstance(hit[2], dict)
+        ):
+            return hit[2]
+        data = _read_fd(fd, st.st_size)
+    finally:
+        os.close(fd)
+
+    raw = _read_toml(data) if p.suffix.lower() == ".toml" else _read_yaml(data, p)
+    if st.st_mtime_ns >= time.time_ns() - CONFIG_CACHE_RACY_NS:
+        return raw
+    # Evict entries for config files that are gone (scratch --config files, CI temp dirs)
+    cache = {k: v for k, v in cache.items() if isinstance(k, str) and os.path.exists(k)}
+    cache[key] = (st.st_mtime_ns, st.st_size, raw)
+    _store_cache(cache)
+    return raw
 
 
 def _to_path(value: Optional[str | os.PathLike[str]], *, base_dir: Path) -> Path:
@@ -121,10 +223,7 @@ def load_config(*, config_path: Optional[Path] = None, base_dir: Optional[Path]
     raw: Dict[str, Any] = {}
     if file_path is not None:
         try:
-            if file_path.suffix.lower() == ".toml":
-                raw = _read_toml(file_path)
-            else:
-                raw = _read_yaml(file_path)
+            raw = _read_config_file(file_path)
             log.debug("Loaded config from %s", file_path)
         except Exception as exc:  # pragma: no cover - defensive
             print(f"Failed to load config: {exc}", file=sys.stderr)
@@ -162,8 +261,11 @@ def load_config(*, config_path: Optional[Path] = None, base_dir: Optional[Path]
 
 
 def ensure_directories(cfg: AppConfig) -> None:
-    cfg.paths.overlay_dir.mkdir(parents=True, exist_ok=True)
-    cfg.paths.props_dir.mkdir(parents=True, exist_ok=True)
-    cfg.paths.commands_dir.mkdir(parents=True, exist_ok=True)
-    cfg.paths.logs_dir.mkdir(parents=True, exist_ok=True)
+    paths = cfg.paths
+    dirs = [paths.props_dir, paths.commands_dir, paths.logs_dir]
+    # overlay_dir comes for free as a parent of props/commands unless those were moved elsewhere
+    if not any(paths.overlay_dir in d.parents for d in dirs):
+        dirs.insert(0, paths.overlay_dir)
+    for d in dirs:
+        d.mkdir(parents=True, exist_ok=True)
 
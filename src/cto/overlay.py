@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from .config import AppConfig, ensure_directories
 
@@ -10,7 +11,31 @@ def init_overlay(cfg: AppConfig) -> None:
     ensure_directories(cfg)
 
 
+def _walk_files(root: str) -> Iterator[Path]:
+    # DirEntry carries the file type from the directory read, so this avoids
+    # a stat per entry. Like rglob, symlinked directories are not descended and
+    # directories that can't be read (or vanish mid-walk) are skipped.
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+                continue
+            try:
+                # is_file() follows symlinks; a loop or broken link raises instead of
+                # returning False, so treat any error as "not a file"
+                is_file = entry.is_file()
+            except OSError:
+                is_file = False
+            if is_file:
+                yield Path(entry.path)
+
+
 def list_overlay_files(cfg: AppConfig) -> List[Path]:
-    if not cfg.paths.overlay_dir.exists():
+    overlay_dir = os.fspath(cfg.paths.overlay_dir)
+    if not os.path.isdir(overlay_dir):
         return []
-    return sorted(p for p in cfg.paths.overlay_dir.rglob("*") if p.is_file())
+    return sorted(_walk_files(overlay_dir))